@@ -6,29 +6,83 @@ objectified versions of API responses.
 """
 
 import datetime
-import lxml.etree
+from lxml import etree
 from openprovider.util import camel_to_snake, snake_to_camel
 
 
+# Default for keyword argument lookups, since None is a valid value
+_MISSING = object()
+
+
+class _MissingAttributeError(AttributeError):
+    """
+    Raised for a missing Model attribute. The message in args is a plain
+    string; the list of available attributes is only appended by __str__, so
+    it isn't built unless the error is actually formatted.
+    """
+
+    def __init__(self, attr, model=None):
+        super(_MissingAttributeError, self).__init__("Model has no attribute '%s'" % attr)
+        self.model = model
+
+    def __str__(self):
+        message = super(_MissingAttributeError, self).__str__()
+        if self.model is None:
+            return message
+        return "%s (tried %r)" % (message, dir(self.model))
+
+    def __reduce__(self):
+        # Don't drag the model and its tree along when pickling
+        return AttributeError, self.args
+
+
 class Model(object):
     """
     Superclass for all models. Delegates attribute access to a wrapped class.
     """
 
+    # Subclasses declare empty __slots__ so instances don't get a __dict__
+    __slots__ = ('_obj', '_attrs', '_child_dir')
+
     def __init__(self, obj=None, **kwargs):
         self._obj = obj
-        self._attrs = dict((snake_to_camel(key), value) for (key, value) in kwargs.items())
+        # Keys are normalised once, so reads are a single dict lookup
+        self._attrs = {snake_to_camel(key): value for key, value in kwargs.items()}
+        self._child_dir = None
 
-    def __dir__(self):
-        attrs = set(list(self.__dict__.keys()) + [camel_to_snake(key) for key in self._attrs.keys()])
+    def _get_child(self, tag):
+        """
+        Returns the first child of the wrapped element with exactly this tag,
+        or None. No case conversion is done, so callers that already know the
+        tag skip it entirely.
+        """
+        if self._obj is None:
+            return None
+        try:
+            # Unlike find(), this only ever matches a plain child tag
+            return self._obj[tag]
+        except (AttributeError, KeyError, ValueError):
+            return None
+
+    def _child_tags(self):
+        """Yields the snake_cased tags of the wrapped element's children."""
         if self._obj is not None:
-            attrs.update(camel_to_snake(t.tag) for t in self._obj.iterchildren())
+            for child in self._obj.iterchildren():
+                if isinstance(child.tag, str):
+                    yield camel_to_snake(child.tag)
+
+    def __dir__(self):
+        attrs = {camel_to_snake(key) for key in self._attrs}
+        if self._child_dir is None:
+            # The wrapped element doesn't change, so its part is only computed once
+            self._child_dir = frozenset(self._child_tags())
+        attrs.update(self._child_dir)
         return [attr for attr in attrs if not attr.startswith('_')]
 
     def __getattr__(self, attr):
         """
         Magic for returning an attribute. Will try the attributes of the
-        wrapper class first, then attributes in self._attrs, then the attributes
+        wrapper class first, then attributes in self._attrs, then the children
         of the wrapped objectified element.
 
         Will try a camelCased version of the snake_cased input if the attribute
@@ -36,24 +90,22 @@ class Model(object):
         as foo.companyName.
         """
 
-        if "_" in attr:
-            attr = snake_to_camel(attr)
+        if attr.startswith('_'):
+            # Internal attributes are never delegated; this also prevents
+            # infinite recursion before __init__ has run.
+            raise AttributeError(attr)
 
-        if attr in self.__dict__:
-            # Check ourselves first to avoid infinite loops
-            return getattr(self, attr)
+        key = snake_to_camel(attr) if "_" in attr else attr
 
-        try:
-            return self._attrs[attr]
-        except KeyError:
-            if self._obj is not None:
-                try:
-                    return self._obj[attr]
-                except (AttributeError, KeyError):
-                    pass
+        value = self._attrs.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+
+        child = self._get_child(key)
+        if child is not None:
+            return child
 
-        raise AttributeError("Model has no attribute '%s' (tried %r)"
-                             % (camel_to_snake(attr), dir(self)))
+        raise _MissingAttributeError(attr, self)
 
     def get_elem(self):
         """Returns the wrapped lxml element, if one exists, or else None."""
@@ -61,40 +113,46 @@ class Model(object):
 
     def dump(self, *args, **kwargs):
         """Dumps a representation of the Model on standard output."""
-        lxml.etree.dump(self._obj, *args, **kwargs)
+        etree.dump(self._obj, *args, **kwargs)
 
     def __repr__(self):
         args = ', '.join('%s=%r' % (attr, getattr(self, attr)) for attr in dir(self))
         return "<%s.%s(%s)>" % (type(self).__module__, type(self).__name__, args)
 
     def __str__(self):
-        return str(lxml.etree.tostring(self._obj)) if self._obj is not None else 'Empty model'
+        return str(etree.tostring(self._obj)) if self._obj is not None else 'Empty model'
 
 
 def submodel(klass, key):
-    """Shortcut for defining a submodel (has-a relation)."""
+    """
+    Shortcut for defining a submodel (has-a relation). The key is used as-is,
+    so it must match the tag of the child element exactly.
+    """
     def getter(self):
-        return klass(getattr(self._obj, key))
+        child = self._get_child(key)
+        if child is None:
+            raise AttributeError(key)
+        return klass(child)
     return property(getter)
 
 
 def textattribute(attr):
-    # TODO: Lots of duplication with __getattr__
+    # Normalised like Model.__init__ normalises keyword arguments
+    key = snake_to_camel(camel_to_snake(attr))
+
     def getter(self):
-        try:
-            return self._attrs[attr]
-        except KeyError:
-            if self.get_elem() is not None:
-                try:
-                    return self.get_elem()[attr].text
-                except (AttributeError, KeyError):
-                    pass
+        value = self._attrs.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
 
-        raise AttributeError("Model has no attribute '%s' (tried %r)"
-                             % (camel_to_snake(attr), dir(self)))
+        child = self._get_child(attr)
+        if child is not None:
+            return child.text
+
+        raise _MissingAttributeError(camel_to_snake(attr), self)
 
     def setter(self, value):
-        self._attrs[attr] = value
+        self._attrs[key] = value
 
     return property(getter, setter)
 
@@ -113,13 +171,19 @@ class Name(Model):
         Last name
     """
 
+    __slots__ = ()
+
     def __eq__(self, other):
         attributes = ['initials', 'first_name', 'prefix', 'last_name']
         return all(getattr(self, attr, None) == getattr(other, attr, None) for attr in attributes)
 
     def __str__(self):
-        if getattr(self, "prefix", None):
-            return "%s %s %s" % (self.first_name, self.prefix, self.last_name)
+        # Probe for the prefix directly; it's missing for most names
+        prefix = self._attrs.get("prefix")
+        if prefix is None:
+            prefix = self._get_child("prefix")
+        if prefix:
+            return "%s %s %s" % (self.first_name, prefix, self.last_name)
         else:
             return "%s %s" % (self.first_name, self.last_name)
 
@@ -134,6 +198,8 @@ class Domain(Model):
         The extension part of the domain name
     """
 
+    __slots__ = ()
+
     def __str__(self):
         return "%s.%s" % (self.name, self.extension)
 
@@ -146,12 +212,14 @@ class RegistryDetails(Model):
         A list of messages
     """
 
+    __slots__ = ()
+
     @property
     def messages(self):
-        try:
-            return [RegistryMessage(item) for item in self.array[0].item]
-        except AttributeError:
+        array = self._get_child("array")
+        if array is None:
             return []
+        return [RegistryMessage(item) for item in array.iterchildren("item")]
 
 
 class RegistryMessage(Model):
@@ -164,19 +232,16 @@ class RegistryMessage(Model):
         The actual message
     """
 
+    __slots__ = ()
+
     message = textattribute("message")
 
     @property
     def date(self):
-        date = None
         try:
             date = self._attrs['date']
         except KeyError:
-            if self._obj is not None:
-                try:
-                    date = self._obj['date']
-                except (AttributeError, KeyError):
-                    pass
+            date = self._get_child('date')
 
         return datetime.datetime.strptime(str(date), '%Y-%m-%d %H:%M:%S') if date else None
 
@@ -187,6 +252,8 @@ class DomainDetails(Model):
     A detailed domain.
     """
 
+    __slots__ = ()
+
     domain = submodel(Domain, "domain")
     registry_details = submodel(RegistryDetails, "registryDetails")
 
@@ -206,6 +273,8 @@ class Nameserver(Model):
         IPv6 address of the nameserver
     """
 
+    __slots__ = ()
+
     def __str__(self):
         return str(self.name)
 
@@ -227,7 +296,7 @@ class Record(Model):
     ttl (required)
         The Time To Live of the record; this is a value in seconds
     """
-    pass
+    __slots__ = ()
 
 
 class History(Model):
@@ -241,7 +310,7 @@ class History(Model):
     is (required)
         New contents of the record
     """
-    pass
+    __slots__ = ()
 
 
 class Address(Model):
@@ -257,6 +326,8 @@ class Address(Model):
     country (required)
     """
 
+    __slots__ = ()
+
     def __eq__(self, other):
         attributes = ['street', 'number', 'suffix', 'zipcode', 'city', 'state', 'country']
         return all(getattr(self, attr, None) == getattr(other, attr, None) for attr in attributes)
@@ -271,6 +342,8 @@ class Phone(Model):
     subscriber_number (required)
     """
 
+    __slots__ = ()
+
     country_code = textattribute("countryCode")
     area_code = textattribute("areaCode")
     subscriber_number = textattribute("subscriberNumber")
@@ -298,6 +371,8 @@ class Reseller(Model):
     reservedBalance
     """
 
+    __slots__ = ()
+
     address = submodel(Address, "address")
     phone = submodel(Phone, "phone")
     fax = submodel(Phone, "fax")
@@ -318,6 +393,8 @@ class Customer(Model):
     email
     """
 
+    __slots__ = ()
+
     name = submodel(Name, "name")
     address = submodel(Address, "address")
     phone = submodel(Phone, "phone")
@@ -354,7 +431,7 @@ class SSLProduct(Model):
     supportedSoftware
     description
     """
-    pass
+    __slots__ = ()
 
 
 class SSLOrder(Model):
@@ -380,6 +457,8 @@ class SSLOrder(Model):
     rootCertificate
     """
 
+    __slots__ = ()
+
     @property
     def validation_details(self):
         details = []
@@ -403,6 +482,8 @@ class SSLOrderDnsValidationInfo(Model):
     dns_value
     """
 
+    __slots__ = ()
+
 
 class Extension(Model):
     """
@@ -420,4 +501,4 @@ class Extension(Model):
     isTradeAllowed
     restorePrice
     """
-    pass
+    __slots__ = ()
@@ -4,8 +4,31 @@
 Contains a Response class for representing responses from the API.
 """
 
-import lxml
-import lxml.objectify
+import copy
+from lxml import etree, objectify
+
+from openprovider.data.exception_map import from_code
+
+
+# The items of the first results array, relative to the document root
+_XP_ITEMS = etree.XPath("reply/data/results/array[1]/item")
+
+# The ancestors of the results array, from the inside out, excluding the root
+_ARRAY_ANCESTORS = ["results", "data", "reply"]
+
+
+def _is_result_item(elem):
+    """
+    Returns whether elem is an item of the first results array, like the ones
+    _XP_ITEMS matches, rather than a nested one.
+    """
+    array = elem.getparent()
+    if array is None or array.tag != "array":
+        return False
+    ancestors = [ancestor.tag for ancestor in array.iterancestors()]
+    if ancestors[:-1] != _ARRAY_ANCESTORS:
+        return False
+    return array.getparent().find("array") is array
 
 
 class Response(object):
@@ -14,18 +37,22 @@ class Response(object):
     fields in the response to attributes.
     """
 
+    __slots__ = ('tree', 'reply', 'code', 'desc', 'data', 'array', '_str')
+
     def __init__(self, tree):
         self.tree = tree
 
-        self.reply = self.tree.reply
-        self.code = self.tree.reply.code
-        self.desc = self.tree.reply.desc
-        self.data = self.tree.reply.data
+        reply = tree.reply
+        self.reply = reply
+        self.code = reply.code
+        self.desc = reply.desc
+        self.data = reply.data
 
-        try:
-            self.array = self.tree.reply.array[0]
-        except AttributeError:
-            self.array = []
+        array = reply.find("array")
+        self.array = array[0] if array is not None else []
+
+        # Serialized lazily by __str__
+        self._str = None
 
     def as_model(self, klass):
         """Turns a model-style response into a single model instance."""
@@ -33,13 +60,53 @@ class Response(object):
 
     def as_models(self, klass):
         """Turns an array-style response into a list of models."""
-        try:
-            return [klass(mod) for mod in self.tree.reply.data.results.array[0].item]
-        except AttributeError:
-            return []
+        return list(map(klass, _XP_ITEMS(self.tree)))
+
+    @staticmethod
+    def as_models_streaming(klass, source):
+        """
+        Incrementally parses an array-style response from source (a filename
+        or file-like object) and yields a model for every item. Each item is
+        copied out of the parsed document and then removed from it, so memory
+        use doesn't grow with the number of items.
+
+        Like OpenProvider.request, raises the exception mapped to the reply
+        code if it isn't 0. The code precedes the data, so no models are
+        yielded for such a reply.
+        """
+        context = etree.iterparse(source, tag=("code", "item", "reply"), remove_blank_text=True)
+        context.set_element_class_lookup(objectify.ObjectifyElementClassLookup())
+
+        code = 0
+        for _, elem in context:
+            if elem.tag == "code":
+                if elem.getparent().tag == "reply":
+                    code = int(elem.text)
+                continue
+
+            if elem.tag == "reply":
+                if code != 0:
+                    desc = elem.findtext("desc", "")
+                    data = elem.findtext("data", "")
+                    raise from_code(code)(u"{0} ({1}) {2}".format(desc, code, data), code)
+                continue
+
+            if code != 0 or not _is_result_item(elem):
+                continue
+
+            yield klass(copy.deepcopy(elem))
+
+            elem.clear()
+            parent = elem.getparent()
+            previous = elem.getprevious()
+            while previous is not None:
+                parent.remove(previous)
+                previous = elem.getprevious()
 
     def __str__(self):
-        return lxml.etree.tostring(self.tree, pretty_print=True)
+        if self._str is None:
+            self._str = etree.tostring(self.tree, encoding="unicode", pretty_print=True)
+        return self._str
 
     def dump(self):
-        return lxml.etree.dump(self.tree)
+        return etree.dump(self.tree)
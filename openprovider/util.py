@@ -1,17 +1,13 @@
 # coding=utf-8
 
-from __future__ import print_function
-try:
-    from string import maketrans
-except ImportError:  # Python 3
-    maketrans = str.maketrans
-    basestring = str
+import functools
 import re
 
 
 PHONE_REGEX = re.compile(r'^(\+\d+)\.(\d)(\d+)$')
 
 
+@functools.lru_cache(maxsize=1024)
 def camel_to_snake(string):
     """
     Converts a camelCaseString to a snake_case_string.
@@ -19,9 +15,22 @@ def camel_to_snake(string):
     >>> camel_to_snake("fooBarBaz")
     'foo_bar_baz'
     """
-    return re.sub('([A-Z]+)', r'_\1', string).lower()
-
-
+    if string.islower():
+        return string
+
+    # Single pass: every run of capitals gets one leading underscore
+    chars = []
+    in_capitals = False
+    for char in string:
+        is_capital = 'A' <= char <= 'Z'
+        if is_capital and not in_capitals:
+            chars.append('_')
+        chars.append(char)
+        in_capitals = is_capital
+    return ''.join(chars).lower()
+
+
+@functools.lru_cache(maxsize=1024)
 def snake_to_camel(value):
     """
     Converts a snake_case_string to a camelCaseString.
@@ -34,7 +43,7 @@ def snake_to_camel(value):
 
 
 def parse_phone_number(number):
-    if isinstance(number, basestring):
+    if isinstance(number, str):
         match = PHONE_REGEX.search(number)
         if not match:
             raise ValueError("Invalid phone number")
@@ -49,14 +58,14 @@ def parse_phone_number(number):
 
 def generate_cert_types(products):
     validations = {'domain': 'DV', 'extended': 'EV', 'organization': 'OV'}
-    name_translation = maketrans(' -', '__')
+    name_translation = str.maketrans(' -', '__', '()')
 
     properties = []
 
     for product in products:
-        name = (product.brandName + " " + product.name).upper().translate(name_translation, '()')
+        name = (product.brandName + " " + product.name).upper().translate(name_translation)
 
-        args = map(repr, [product.id, product.brandName, product.name, validations[product.validationMethod]])
+        args = list(map(repr, [product.id, product.brandName, product.name, validations[product.validationMethod]]))
         if product.isWildcardSupported:
             args.append('is_wildcard=True')
         if product.isSgcSupported:
@@ -1,15 +1,14 @@
 # coding=utf-8
 import sys
+from setuptools import setup, find_packages
 
 cmdclass = {}
 
 try:
-    from setuptools import setup
-except ImportError:
-    from distutils.core import setup
-else:
     from setuptools.command.test import test as TestCommand
-
+except ImportError:  # setuptools >= 72 dropped the test command
+    pass
+else:
     class PyTest(TestCommand):
         def initialize_options(self):
             TestCommand.initialize_options(self)
@@ -34,11 +33,12 @@ setup(
     version='0.11.4',
     author='Antagonist B.V.',
     author_email='info@antagonist.nl',
-    packages=['openprovider', 'openprovider.modules', 'openprovider.data'],
+    packages=find_packages(exclude=['tests', 'tests.*']),
     url='https://github.com/AntagonistHQ/openprovider.py',
     license='LICENSE.rst',
     description='An unofficial library for the OpenProvider API',
     long_description=open('README.rst').read(),
+    python_requires='>=3.7',
     install_requires=[
         "requests >= 2.3.0",
         "lxml >= 3.3.5",
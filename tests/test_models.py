@@ -2,9 +2,11 @@
 
 """Contains tests both for the models system and for the models themselves."""
 
+import lxml.objectify
+import pickle
 import pytest
 
-from openprovider.models import Model, Name, Domain, Phone, Address
+from openprovider.models import Model, Name, Domain, Phone, Address, Customer, RegistryDetails
 
 
 def test_model_construct_kwargs():
@@ -25,12 +27,124 @@ def test_model_camel_case():
     assert mod.spamandeggs == "Spam, spam, glorious spam"
 
 
+def test_textattribute_kwargs():
+    phone = Phone(country_code="+31")
+    assert phone.country_code == "+31"
+    phone.country_code = "+32"
+    assert phone.country_code == "+32"
+    assert phone._attrs == {"countryCode": "+32"}
+
+
+def test_textattribute_wrapped_element():
+    elem = lxml.objectify.fromstring(
+        "<phone><countryCode>+31</countryCode><areaCode>53</areaCode><subscriberNumber>1234567</subscriberNumber></phone>")
+    assert str(Phone(elem)) == "+31 53 1234567"
+
+
+def test_model_wrapped_element():
+    """Tests attribute access on a Model wrapping an objectified element."""
+    elem = lxml.objectify.fromstring("<data><companyName>Foo</companyName><vatperc>21</vatperc></data>")
+    mod = Model(elem)
+    assert mod.company_name == "Foo"
+    assert mod.companyName == "Foo"
+    assert mod.vatperc == 21
+
+
+def test_model_attrs_override_wrapped_element():
+    elem = lxml.objectify.fromstring("<data><companyName>Foo</companyName></data>")
+    mod = Model(elem, company_name="Bar")
+    assert mod.company_name == "Bar"
+
+
+def test_model_missing_attribute():
+    mod = Model(lxml.objectify.fromstring("<data><companyName>Foo</companyName></data>"))
+    with pytest.raises(AttributeError) as excinfo:
+        mod.spam_and_eggs
+    assert "spam_and_eggs" in str(excinfo.value)
+    assert "company_name" in str(excinfo.value)
+    assert excinfo.value.args == ("Model has no attribute 'spam_and_eggs'",)
+
+
+def test_model_missing_attribute_pickles_without_model():
+    mod = Model(lxml.objectify.fromstring("<data><companyName>Foo</companyName></data>"))
+    with pytest.raises(AttributeError) as excinfo:
+        mod.spam_and_eggs
+    error = pickle.loads(pickle.dumps(excinfo.value))
+    assert error.args == excinfo.value.args
+
+
+@pytest.mark.parametrize("name", ["companyName/first", "*", "company name", "", "{urn:x}companyName"])
+def test_model_non_tag_attribute(name):
+    """Attribute names are never interpreted as paths or patterns."""
+    mod = Model(lxml.objectify.fromstring("<data><companyName><first>Foo</first></companyName></data>"))
+    assert not hasattr(mod, name)
+    assert getattr(mod, name, None) is None
+
+
+def test_model_missing_attribute_keeps_name():
+    with pytest.raises(AttributeError) as excinfo:
+        Model().spamAndEggs
+    assert "'spamAndEggs'" in str(excinfo.value)
+
+
+def test_model_dir():
+    mod = Model(lxml.objectify.fromstring("<data><companyName>Foo</companyName></data>"), vat="NL")
+    assert sorted(dir(mod)) == ["company_name", "vat"]
+
+
+@pytest.mark.parametrize("klass", [Model, Name, Address, Customer])
+def test_model_has_no_instance_dict(klass):
+    assert not hasattr(klass(), "__dict__")
+
+
+def test_wrapping_model_has_no_instance_dict():
+    elem = lxml.objectify.fromstring("<data><handle>XX123456-NL</handle></data>")
+    assert not hasattr(Customer(elem), "__dict__")
+
+
+def test_submodel_wrapped_element():
+    elem = lxml.objectify.fromstring("<data><handle>XX123456-NL</handle><address><city>Amsterdam</city></address></data>")
+    customer = Customer(elem)
+    assert isinstance(customer.address, Address)
+    assert customer.address.city == "Amsterdam"
+    assert getattr(customer, "fax", None) is None
+
+
+def test_submodel_kwargs():
+    name = Name(first_name="Leonardo", last_name="Vinci")
+    assert Customer(name=name).name is name
+
+
+def test_registry_details_messages():
+    elem = lxml.objectify.fromstring(
+        "<registryDetails><array><item><date>2015-03-04 12:00:00</date><message>Hello</message></item>"
+        "</array></registryDetails>")
+    messages = RegistryDetails(elem).messages
+    assert [message.message for message in messages] == ["Hello"]
+    assert messages[0].date.year == 2015
+
+
+def test_registry_details_without_messages():
+    assert RegistryDetails(lxml.objectify.fromstring("<registryDetails/>")).messages == []
+
+
 def test_name_str():
     """Tests the Name model and its string conversion."""
     leo = Name(first_name="Leonardo", prefix="da", last_name="Vinci")
     assert str(leo) == "Leonardo da Vinci"
 
 
+def test_name_str_without_prefix():
+    assert str(Name(first_name="Leonardo", last_name="Vinci")) == "Leonardo Vinci"
+    assert str(Name(first_name="Leonardo", prefix="", last_name="Vinci")) == "Leonardo Vinci"
+
+
+def test_name_str_wrapped_element():
+    elem = lxml.objectify.fromstring(
+        "<name><firstName>Vincent</firstName><prefix>van</prefix><lastName>Gogh</lastName></name>")
+    assert str(Name(elem)) == "Vincent van Gogh"
+
+
 @pytest.mark.parametrize("first,second", [
     (Name(), Name()),
     (
@@ -0,0 +1,84 @@
+# coding=utf-8
+
+"""Contains tests for the Response class."""
+
+import io
+import lxml.objectify
+import pytest
+
+from openprovider.exceptions import NoSuchElement
+from openprovider.models import Model
+from openprovider.response import Response
+
+
+def _response(body):
+    return Response(lxml.objectify.fromstring("<openXML><reply>%s</reply></openXML>" % body))
+
+
+def test_response_unwraps_reply():
+    response = _response("<code>0</code><desc></desc><data><name>example</name></data>")
+    assert response.code == 0
+    assert response.desc == ""
+    assert response.data.name == "example"
+    assert response.array == []
+
+
+def test_response_array():
+    response = _response("<code>0</code><desc></desc><data/><array><item>1</item><item>2</item></array>")
+    assert [int(item) for item in response.array.item] == [1, 2]
+
+
+def test_response_as_models():
+    response = _response(
+        "<code>0</code><desc></desc><data><results><array>"
+        "<item><name>nl</name><prices><array><item>1</item></array></prices></item>"
+        "<item><name>com</name></item>"
+        "</array></results></data>"
+    )
+    models = response.as_models(Model)
+    assert [str(mod.name) for mod in models] == ["nl", "com"]
+
+
+def test_response_as_models_streaming():
+    source = io.BytesIO(
+        b"<openXML><reply><code>0</code><desc></desc><data><results><array>"
+        b"<item><name>nl</name><prices><array><item>1</item></array></prices></item>"
+        b"<item><name>com</name><usageCount>3</usageCount></item>"
+        b"</array></results></data></reply></openXML>"
+    )
+    models = list(Response.as_models_streaming(Model, source))
+    assert [str(mod.name) for mod in models] == ["nl", "com"]
+    assert models[0].prices.array.item == 1
+    assert models[1].usage_count == 3
+
+
+def test_response_as_models_streaming_first_array_only():
+    source = io.BytesIO(
+        b"<openXML><reply><code>0</code><desc></desc><data><results>"
+        b"<array><item><name>nl</name></item></array>"
+        b"<array><item><name>com</name></item></array>"
+        b"</results></data></reply></openXML>"
+    )
+    models = list(Response.as_models_streaming(Model, source))
+    assert [str(mod.name) for mod in models] == ["nl"]
+
+
+def test_response_as_models_streaming_error():
+    source = io.BytesIO(
+        b"<openXML><reply><code>99</code><desc>No data returned</desc><data></data></reply></openXML>"
+    )
+    with pytest.raises(NoSuchElement) as excinfo:
+        list(Response.as_models_streaming(Model, source))
+    assert excinfo.value.code == 99
+
+
+def test_response_as_models_without_results():
+    response = _response("<code>0</code><desc></desc><data/>")
+    assert response.as_models(Model) == []
+
+
+def test_response_str():
+    response = _response("<code>0</code><desc></desc><data/>")
+    assert isinstance(str(response), str)
+    assert "<code>0</code>" in str(response)
+    assert str(response) is str(response)
@@ -11,6 +11,8 @@ from openprovider.util import camel_to_snake, snake_to_camel, parse_phone_number
     ("name", "name"),
     ("companyName", "company_name"),
     ("spamAndEggs", "spam_and_eggs"),
+    ("domainNameURL", "domain_name_url"),
+    ("ip6", "ip6"),
 ])
 def test_camel_to_snake(value, expected):
     assert camel_to_snake(value) == expected